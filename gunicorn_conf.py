@@ -0,0 +1,21 @@
+"""Gunicorn settings for the web app.
+
+    gunicorn -c gunicorn_conf.py src.web.app:app
+
+An analysis is mostly spent waiting on Brave, PDF downloads and Claude, so
+one worker process with many threads keeps many requests in flight.
+"""
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:5002")
+
+# Analysis jobs and their results live in the worker's memory, and clients
+# poll /analyze/<job_id> on whichever worker answers, so keep a single
+# process and scale with threads
+workers = int(os.getenv("WEB_WORKERS", 1))
+worker_class = "gthread"
+threads = int(os.getenv("WEB_THREADS", 16))
+
+# Polls and page loads are quick; the long work happens on the background pool
+timeout = 120
+keepalive = 5
@@ -5,14 +5,20 @@
 import re
 import json
 import logging
+import threading
 from typing import Dict, Optional, List
 from anthropic import Anthropic
-from ..config import CLAUDE_API_KEY
+from ..config import CLAUDE_API_KEY, MAX_CONCURRENT_CLAUDE_REQUESTS, MAX_RETRIES
+
+# Shared by every analyzer so concurrent analyses can't stampede the API
+# into 429s; a call waiting out a retry keeps its slot
+_claude_slots = threading.BoundedSemaphore(MAX_CONCURRENT_CLAUDE_REQUESTS)
 
 
 class EmissionsAnalyzer:
     def __init__(self):
-        self.client = Anthropic(api_key=CLAUDE_API_KEY)  # Initialize the Claude API client.
+        # The SDK retries 429/5xx itself, waiting as long as the Retry-After header asks
+        self.client = Anthropic(api_key=CLAUDE_API_KEY, max_retries=MAX_RETRIES)  # Initialize the Claude API client.
         self.scope_pattern = r'(?i)scope\s*[12]'  # Regex to identify Scope 1 and 2 in text.
 
     def extract_emissions_data(self, text: str, company_name: str = None) -> Optional[Dict]:
@@ -162,12 +168,13 @@ class EmissionsAnalyzer:
 
         try:
             logging.info("Sending request to Claude...")
-            response = self.client.messages.create(
-                model="claude-3-sonnet-20240229",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0,
-                max_tokens=4096
-            )
+            with _claude_slots:
+                response = self.client.messages.create(
+                    model="claude-3-sonnet-20240229",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0,
+                    max_tokens=4096
+                )
 
             if not response.content or not response.content[0].text:
                 logging.warning("No content in Claude response")
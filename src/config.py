@@ -17,14 +17,32 @@ LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 # Rate limiting
 MAX_RETRIES = 3
 RETRY_DELAY = 1  # seconds
+RATE_LIMIT_COOLDOWN = 60  # seconds to pause after a 429 without Retry-After
+BRAVE_REQUESTS_PER_SECOND = float(os.getenv('BRAVE_REQUESTS_PER_SECOND', 1))  # Free plan allows 1/s
+if BRAVE_REQUESTS_PER_SECOND <= 0:
+    BRAVE_REQUESTS_PER_SECOND = 1.0  # Zero or negative would mean no queries at all; use the free-plan rate
+MAX_CONCURRENT_CLAUDE_REQUESTS = int(os.getenv('MAX_CONCURRENT_CLAUDE_REQUESTS', 3))  # In flight across all analyses
 
 # Cache settings
 CACHE_DIR = os.path.join(BASE_DIR, 'cache')
 os.makedirs(CACHE_DIR, exist_ok=True)
+CACHE_DB_PATH = os.path.join(CACHE_DIR, 'cache.sqlite3')
+SEARCH_CACHE_TTL = 7 * 24 * 3600     # Brave responses reused for a week
+DOCUMENT_CACHE_TTL = 90 * 24 * 3600  # Published reports rarely change
+ISIN_CACHE_TTL = 24 * 3600           # Listings change, so ISIN lookups expire daily
 
 # PDF Processing
 MAX_PDF_SIZE = 50 * 1024 * 1024  # 50MB
 PDF_TIMEOUT = 30  # seconds
+PDF_PEEK_BYTES = 256 * 1024  # Leading bytes fetched to pre-check a candidate PDF
+PDF_CACHE_SIZE = 32  # Extracted documents kept in memory per DocumentHandler
+PDF_PARSE_WORKERS = os.cpu_count()  # Processes used for PDF text extraction
+PDF_SCAN_MAX_PAGES = 80  # Pages scanned when validating a candidate PDF
+PDF_PAGES_PER_TASK = 8  # Relevant pages extracted per parse-pool task
+PDF_PAGE_NEIGHBORS = 1  # Pages kept either side of an emissions page for context
+PDF_FILE_CACHE_SIZE = 4  # Validated PDFs kept on disk until fully extracted
+MAX_VALIDATION_WORKERS = 5  # Candidate PDFs validated concurrently
+MAX_PDF_VALIDATIONS = 5  # Top-ranked candidates downloaded per company search
 
 # Search settings
 SEARCH_YEARS = [
@@ -34,6 +52,18 @@ SEARCH_YEARS = [
 ]
 MAX_RESULTS_PER_SEARCH = 5
 MAX_REPORT_AGE_YEARS = 4
+MAX_SEARCH_WORKERS = 8  # Concurrent Brave queries per company search
+
+# Web app settings
+MAX_ANALYSIS_WORKERS = 8  # Analyses run in the background at once
+ANALYSIS_JOB_TTL = 3600   # seconds a finished job's result can still be polled
+ANALYSIS_CACHE_SIZE = 1024  # Completed analyses kept in memory
+ANALYSIS_CACHE_TTL = 3600   # seconds before a company is analysed again
+MAX_REQUEST_BYTES = 64 * 1024  # Larger request bodies are rejected with 413 before parsing
+
+# Search cache settings
+SEARCH_CACHE_SIZE = 1024          # Max distinct search terms kept in memory
+SEARCH_CACHE_NEGATIVE_TTL = 3600  # seconds to remember queries with no results
 
 # Unit conversion settings
 DEFAULT_UNIT = 'metric tons CO2e'
@@ -1,10 +1,214 @@
 import pdfplumber
 import requests
-from typing import Optional, List, Dict
+try:
+    # Optional (AGPL-licensed, see requirements-pymupdf.txt): PyMuPDF extracts
+    # plain page text far faster than pdfminer; tables and column layout
+    # still come from pdfplumber
+    import fitz
+except ImportError:
+    fitz = None
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from requests.adapters import HTTPAdapter
+from typing import Optional, Iterator, List, Dict, Pattern, Union
+import atexit
 import io
 import logging
+import multiprocessing
+import os
+import pickle
 import re
-from ..config import MAX_PDF_SIZE
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from ..config import (
+    MAX_PDF_SIZE,
+    PDF_TIMEOUT,
+    PDF_PEEK_BYTES,
+    PDF_CACHE_SIZE,
+    PDF_PARSE_WORKERS,
+    PDF_SCAN_MAX_PAGES,
+    PDF_FILE_CACHE_SIZE,
+    PDF_PAGES_PER_TASK,
+    PDF_PAGE_NEIGHBORS,
+    DOCUMENT_CACHE_TTL
+)
+from ..utils.helpers import build_http_adapter
+from ..utils.cache import DiskCache
+
+# Parsing is CPU-bound (pdfminer layout analysis), so it runs in a shared
+# process pool; created on first use so importing this module stays cheap
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # Spawn rather than fork: the pool is started from a request or
+            # validation thread, and forking a multi-threaded process can
+            # leave another thread's locks held forever in the child
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=PDF_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _parse_pool
+
+
+def _reset_parse_pool() -> None:
+    global _parse_pool
+    with _parse_pool_lock:
+        _parse_pool = None
+
+
+def _submit(func, *args):
+    """Queue func(*args) on the parse pool; None if the pool can't take work (shut down, can't start workers)."""
+    try:
+        return _get_parse_pool().submit(func, *args)
+    except (RuntimeError, OSError, pickle.PicklingError) as e:
+        logging.warning(f"Parse pool unavailable, parsing in-process: {str(e)}")
+        return None
+
+
+def _pool_result(future, func, *args):
+    """Result of a queued func(*args), re-run in-process if the pool broke or couldn't ship the call.
+
+    Exceptions raised by func itself (e.g. a corrupt PDF) propagate; running
+    it again in-process would only fail the same way at twice the cost.
+    """
+    if future is None:
+        return func(*args)
+    try:
+        return future.result()
+    except (BrokenProcessPool, pickle.PicklingError) as e:
+        if isinstance(e, BrokenProcessPool):
+            # A worker died; start a fresh pool on the next document
+            _reset_parse_pool()
+        logging.warning(f"Parse pool unavailable, parsing in-process: {str(e)}")
+        return func(*args)
+
+
+def _run_in_pool(func, *args):
+    """Run func(*args) in the parse pool, falling back to in-process if the pool is unavailable."""
+    return _pool_result(_submit(func, *args), func, *args)
+
+
+def _map_in_pool(func, pdf_path: str, batches: List[List[int]]) -> List:
+    """Run func(pdf_path, batch) for every batch at once in the parse pool; results keep batch order."""
+    futures = [_submit(func, pdf_path, batch) for batch in batches]
+    return [_pool_result(future, func, pdf_path, batch) for future, batch in zip(futures, batches)]
+
+
+_worker_handler: Optional["DocumentHandler"] = None
+
+
+def _get_worker_handler() -> "DocumentHandler":
+    global _worker_handler
+    # One handler per worker process, reused across documents
+    if _worker_handler is None:
+        _worker_handler = DocumentHandler()
+    return _worker_handler
+
+
+def _relevant_pages_in_worker(pdf_path: str) -> List[int]:
+    """Module-level (picklable) entry point for finding a PDF's data pages in the process pool."""
+    return _get_worker_handler()._find_relevant_pages(pdf_path)
+
+
+def _extract_pages_in_worker(pdf_path: str, page_nums: List[int]) -> List[str]:
+    """Module-level (picklable) entry point for extracting a batch of pages in the process pool."""
+    return _get_worker_handler()._extract_pages(pdf_path, page_nums)
+
+
+# Cheap page-level filter for emissions content, so only candidate pages get
+# the expensive table/column extraction and are sent on for analysis
+_EMISSIONS_PAGE_RE = re.compile(r"\b(scope\s*[123]|ghg|m?t?co2e?|emissions|greenhouse)\b", re.IGNORECASE)
+
+
+def _matches(text: str, pattern: Pattern, prefilter: Optional[str]) -> bool:
+    """Search text for pattern, skipping the regex when the lowercase prefilter literal is absent."""
+    if prefilter and prefilter not in text.lower():
+        return False
+    return pattern.search(text) is not None
+
+
+class _TextOnlyInterpreter(PDFPageInterpreter):
+    """Page interpreter that ignores path-construction, painting and colour operators.
+
+    Charts and infographics make up most of a sustainability report's content
+    streams, but only the text operators produce characters, so there is no
+    point building paths nobody reads when all we want is plain text.
+    """
+
+    def _skip(self) -> None:
+        # pdfminer pops as many operands as the handler takes (none here), so
+        # drop the skipped operator's operands ourselves; left on the stack
+        # they would pile up and be copied by every later pop()
+        self.argstack = []
+
+    do_m = do_l = do_c = do_v = do_y = do_h = do_re = _skip
+    do_S = do_s = do_f = do_F = do_f_a = do_B = do_B_a = do_b = do_b_a = do_n = _skip
+    do_rg = do_RG = do_g = do_G = do_k = do_K = do_cs = do_CS = _skip
+    do_sc = do_SC = do_scn = do_SCN = _skip
+
+
+# Text only, with ligatures expanded ("ﬁ" -> "fi") so keyword patterns still match
+_FITZ_TEXT_FLAGS = (fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP) if fitz is not None else 0
+
+
+def _pdfminer_page_texts(pdf_file, max_pages: Optional[int]) -> Iterator[str]:
+    rsrcmgr = PDFResourceManager(caching=True)
+    output = io.StringIO()
+    device = TextConverter(rsrcmgr, output, laparams=LAParams())
+    interpreter = _TextOnlyInterpreter(rsrcmgr, device)
+    try:
+        for page in PDFPage.get_pages(pdf_file, maxpages=max_pages or 0):
+            output.seek(0)
+            output.truncate()
+            interpreter.process_page(page)
+            yield output.getvalue()
+    finally:
+        device.close()
+
+
+def _page_texts(pdf_content: Union[str, io.BytesIO], max_pages: Optional[int] = None) -> Iterator[str]:
+    """Plain text of each page in order, using PyMuPDF when it's installed and a text-only pdfminer pass otherwise."""
+    if fitz is not None:
+        if isinstance(pdf_content, str):
+            doc = fitz.open(pdf_content)
+        else:
+            doc = fitz.open(stream=pdf_content.getvalue(), filetype="pdf")
+        with doc:
+            last_page = doc.page_count if max_pages is None else min(max_pages, doc.page_count)
+            for page in doc.pages(0, last_page):
+                yield page.get_text("text", flags=_FITZ_TEXT_FLAGS)
+        return
+
+    if isinstance(pdf_content, str):
+        with open(pdf_content, "rb") as pdf_file:
+            yield from _pdfminer_page_texts(pdf_file, max_pages)
+    else:
+        pdf_content.seek(0)
+        yield from _pdfminer_page_texts(pdf_content, max_pages)
+
+
+def _scan_in_worker(pdf_path: str, pattern: Pattern, max_pages: int, prefilter: Optional[str]) -> bool:
+    """Module-level (picklable) entry point for a page-by-page pattern scan in the process pool."""
+    return any(_matches(text, pattern, prefilter) for text in _page_texts(pdf_path, max_pages))
+
+
+def _discard_download(download: Dict) -> None:
+    """Delete the temporary file behind a download, if it has one."""
+    if download.get("path"):
+        try:
+            os.unlink(download["path"])
+        except OSError:
+            pass
+
 
 class DocumentHandler:
     """# PDF Document Handler for Emissions Data Extraction
@@ -15,7 +219,15 @@ class DocumentHandler:
     # - Tags content types (TABLE, TEXT, DATA, HEADER)
     # - Maintains page numbers and section markers
     """
-    def __init__(self):
+    def __init__(self, adapter: Optional[HTTPAdapter] = None):
+        # Keep-alive session for PDF downloads; pass an adapter to share
+        # connection pools (and retry policy) with another client
+        adapter = adapter or build_http_adapter()
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Core patterns to identify relevant sections
         self.data_patterns = [
             r'(?i)scope\s*[123]',     # Emissions scope references
@@ -27,86 +239,337 @@ class DocumentHandler:
         # Column handling settings
         self.x_tolerance = 3          # Horizontal spacing for word grouping
         self.y_tolerance = 3          # Vertical spacing for line detection
+        # Extracted text per URL, so a report validated during search isn't
+        # downloaded and parsed again for analysis (least recently used evicted first)
+        self._content_cache: Dict[str, str] = {}
+        # Extracted text also persists across runs
+        # Entries are {"text", "etag", "last_modified"} so expired ones can be
+        # revalidated with a conditional GET instead of a full re-download
+        # (kept one more TTL past expiry for that, then purged)
+        self._document_cache = DiskCache("document_text", DOCUMENT_CACHE_TTL, keep_expired=DOCUMENT_CACHE_TTL)
+        # Downloads (temp file and validators) of PDFs that passed
+        # contains_pattern, held until the full extraction that usually
+        # follows so the file isn't downloaded twice
+        self._pdf_file_cache: Dict[str, Dict] = {}
+        # One handler is shared by the search's validation threads and every
+        # web analysis, so both in-memory caches are only touched under this lock
+        self._cache_lock = threading.Lock()
+        atexit.register(self.close)
+
+    def close(self):
+        """Remove downloaded PDFs that are still waiting for extraction."""
+        with self._cache_lock:
+            downloads = list(self._pdf_file_cache.values())
+            self._pdf_file_cache.clear()
+        for download in downloads:
+            _discard_download(download)
 
     def get_document_content(self, url: str) -> Optional[str]:
         """# Main method to download and process PDF
         # 1. Downloads PDF with error handling
         # 2. Validates PDF content type
         # 3. Extracts and processes content
-        # 4. Saves raw extraction for debugging"""
+        # 4. Saves raw extraction for debugging
+        # Successful extractions are cached per URL"""
+        with self._cache_lock:
+            cached = self._content_cache.pop(url, None)
+            if cached is not None:
+                # Re-insert so eviction drops the least recently used document
+                self._content_cache[url] = cached
+        if cached is not None:
+            logging.info(f"Using cached content for {url}")
+            return cached
+
+        stored = self._document_cache.get(url)
+        if stored is not None:
+            logging.info(f"Using cached content from disk for {url}")
+            self._remember(url, stored["text"])
+            return stored["text"]
+
         try:
-            response = requests.get(
-                url,
-                headers={'User-Agent': 'Mozilla/5.0'},
-                stream=True,
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            if 'application/pdf' not in response.headers.get('content-type', '').lower():
-                logging.warning(f"URL {url} does not point to a PDF")
+            # Published reports rarely change, so an expired entry is usually
+            # still good; ask the server before downloading the whole file
+            expired = self._document_cache.get(url, allow_expired=True)
+            download = self._download(url, validators=expired)
+            if download is None:
                 return None
 
-            extracted = self._extract_content(io.BytesIO(response.content))
+            if download.get("not_modified"):
+                logging.info(f"{url} not modified, reusing cached content")
+                self._remember(url, expired["text"])
+                self._document_cache.set(url, expired)
+                return expired["text"]
+
+            try:
+                extracted = self._extract_file(download["path"])
+            finally:
+                _discard_download(download)
 
             # Save raw extraction for debugging
             if extracted:
                 with open("raw_extracted_data.txt", "w", encoding="utf-8") as f:
                     f.write(extracted)
 
+                self._remember(url, extracted)
+                self._document_cache.set(url, {
+                    "text": extracted,
+                    "etag": download.get("etag"),
+                    "last_modified": download.get("last_modified")
+                })
+
             return extracted
 
         except Exception as e:
             logging.error(f"Failed to get document: {str(e)}")
             return None
 
-    def _extract_content(self, pdf_content: io.BytesIO) -> Optional[str]:
-        """# Main content extraction logic
-        # Process:
-        # 1. First pass identifies relevant pages
-        # 2. Extracts tables first (more structured)
-        # 3. Then extracts surrounding text
-        # 4. Preserves page numbers and content markers"""
+    def contains_pattern(self, url: str, pattern: Pattern, max_pages: int = PDF_SCAN_MAX_PAGES,
+                         prefilter: Optional[str] = None) -> Optional[bool]:
+        """# Cheap check that a PDF mentions a pattern
+        # 1. Uses already-extracted text when we have it
+        # 2. Otherwise scans plain page text, stopping at the first match
+        #    or after max_pages (no table/column processing)
+        # 3. Keeps a matching PDF's file for the full extraction that follows
+        # prefilter is an optional lowercase literal every match contains;
+        # pages without it are rejected by a substring scan before the regex
+        # Returns None if the document couldn't be fetched"""
+        with self._cache_lock:
+            cached = self._content_cache.get(url)
+        if cached is None:
+            stored = self._document_cache.get(url)
+            cached = stored["text"] if stored else None
+        if cached is not None:
+            return _matches(cached, pattern, prefilter)
+
         try:
-            with pdfplumber.open(pdf_content) as pdf:
-                extracted_content = []
-                
-                # Find pages with relevant content first
-                relevant_pages = []
-                for page_num, page in enumerate(pdf.pages):
-                    text = page.extract_text() or ""
-                    if any(re.search(pattern, text) for pattern in self.data_patterns):
-                        relevant_pages.append(page_num)
-
-                # Process identified pages
-                for page_num in relevant_pages:
-                    page = pdf.pages[page_num]
-                    
-                    # Handle tables first
-                    tables = page.extract_tables()
-                    for table_num, table in enumerate(tables, 1):
-                        if table and len(table) > 1:
-                            processed_table = self._process_table(table)
-                            if processed_table:
-                                extracted_content.append(
-                                    f"=== TABLE {table_num} ON PAGE {page_num + 1} ===\n{processed_table}\n"
-                                )
-
-                    # Then handle text with column awareness
-                    text = self._extract_text_with_columns(page)
-                    if text:
-                        context = self._process_text(text)
-                        if context:
-                            extracted_content.append(
-                                f"=== TEXT ON PAGE {page_num + 1} ===\n{context}\n"
-                            )
+            download = self._download(url)
+            if download is None:
+                return None
 
-                return "\n".join(extracted_content) if extracted_content else None
+            try:
+                found = _run_in_pool(_scan_in_worker, download["path"], pattern, max_pages, prefilter)
+                if found:
+                    self._stash_download(url, download)
+                    download = None  # now owned by the file cache
+                return found
+            finally:
+                if download is not None:
+                    _discard_download(download)
 
         except Exception as e:
-            logging.error(f"Extraction error: {str(e)}")
+            logging.error(f"Failed to scan document: {str(e)}")
             return None
 
+    def _download(self, url: str, validators: Optional[Dict] = None) -> Optional[Dict]:
+        """# Fetch a PDF into a temporary file
+        # Streams the body to disk in chunks and gives up past MAX_PDF_SIZE,
+        # so a large report is never held in memory or pickled to a worker
+        # validators ({"etag", "last_modified"} from an earlier fetch) make
+        # the request conditional; an unchanged file comes back as
+        # {"not_modified": True}, otherwise {"path", "etag", "last_modified"}
+        # The caller owns the file and removes it with _discard_download
+        # Returns None if the URL doesn't serve a usable PDF; raises on HTTP errors"""
+        with self._cache_lock:
+            download = self._pdf_file_cache.pop(url, None)
+        if download is not None:
+            return download
+
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        with self.session.get(url, headers=headers, stream=True, timeout=PDF_TIMEOUT) as response:
+            if response.status_code == 304 and headers:
+                return {"not_modified": True}
+            response.raise_for_status()
+
+            if 'application/pdf' not in response.headers.get('content-type', '').lower():
+                logging.warning(f"URL {url} does not point to a PDF")
+                return None
+
+            # Reject oversized files from the headers when possible, otherwise
+            # stop reading as soon as the body passes the limit
+            declared_size = response.headers.get('content-length', '')
+            if declared_size.isdigit() and int(declared_size) > MAX_PDF_SIZE:
+                logging.warning(f"PDF at {url} is too large ({int(declared_size):,} bytes)")
+                return None
+
+            download = {
+                "path": None,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified")
+            }
+            complete = False
+            try:
+                with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as pdf_file:
+                    download["path"] = pdf_file.name
+                    size = 0
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        size += len(chunk)
+                        if size > MAX_PDF_SIZE:
+                            logging.warning(f"PDF at {url} exceeds {MAX_PDF_SIZE:,} bytes, aborting download")
+                            return None
+                        pdf_file.write(chunk)
+                complete = True
+                return download
+            finally:
+                if not complete:
+                    _discard_download(download)
+
+    def _remember(self, url: str, text: str):
+        """Add extracted text to the in-memory cache, evicting the least recently used entry once full."""
+        with self._cache_lock:
+            self._content_cache.pop(url, None)
+            if len(self._content_cache) >= PDF_CACHE_SIZE:
+                self._content_cache.pop(next(iter(self._content_cache)))
+            self._content_cache[url] = text
+
+    def _stash_download(self, url: str, download: Dict):
+        """Keep a download for a later extraction, removing the file of any entry it replaces or evicts."""
+        discarded = []
+        with self._cache_lock:
+            replaced = self._pdf_file_cache.pop(url, None)
+            if replaced is not None:
+                discarded.append(replaced)
+            if len(self._pdf_file_cache) >= PDF_FILE_CACHE_SIZE:
+                discarded.append(self._pdf_file_cache.pop(next(iter(self._pdf_file_cache))))
+            self._pdf_file_cache[url] = download
+        for old in discarded:
+            _discard_download(old)
+
+    def looks_like_pdf(self, url: str) -> bool:
+        """# Cheap HEAD check before any PDF bytes are fetched
+        # Rejects URLs that are gone, redirect to a non-PDF page, or
+        # exceed MAX_PDF_SIZE; anything inconclusive (HEAD refused,
+        # network error, missing headers) is let through to the download"""
+        try:
+            response = self.session.head(url, allow_redirects=True, timeout=5)
+        except requests.RequestException as e:
+            logging.debug(f"HEAD failed for {url}: {str(e)}")
+            return True
+
+        if response.status_code in (404, 410):
+            return False
+        if response.status_code >= 400:
+            return True
+
+        content_type = response.headers.get('content-type', '').lower()
+        if content_type and 'application/pdf' not in content_type:
+            return False
+
+        declared_size = response.headers.get('content-length', '')
+        if declared_size.isdigit() and int(declared_size) > MAX_PDF_SIZE:
+            return False
+        return True
+
+    def peek(self, url: str, n_bytes: int = PDF_PEEK_BYTES) -> Optional[str]:
+        """# Cheap preview of a PDF's opening pages
+        # 1. Requests only the first n_bytes via an HTTP Range header
+        # 2. Caps the read in case the server ignores Range
+        # 3. Returns whatever plain text the partial file yields
+        # Non-linearized PDFs often can't be parsed from a prefix, so a
+        # None result is inconclusive rather than a rejection"""
+        try:
+            # The with block returns the connection to the pool on every path
+            with self.session.get(
+                url,
+                headers={'Range': f'bytes=0-{n_bytes - 1}'},
+                stream=True,
+                timeout=10
+            ) as response:
+                response.raise_for_status()
+
+                if 'application/pdf' not in response.headers.get('content-type', '').lower():
+                    return None
+
+                content = response.raw.read(n_bytes, decode_content=True)
+
+            with pdfplumber.open(io.BytesIO(content)) as pdf:
+                text = "\n".join(page.extract_text() or "" for page in pdf.pages)
+            return text or None
+
+        except Exception as e:
+            logging.debug(f"Could not preview {url}: {str(e)}")
+            return None
+
+    def _extract_file(self, pdf_path: str) -> Optional[str]:
+        """# Main content extraction logic for a downloaded PDF
+        # Process:
+        # 1. One pool task identifies relevant pages
+        # 2. Those pages are split into batches of PDF_PAGES_PER_TASK and
+        #    extracted concurrently, each worker opening the file itself
+        # 3. Each page gives its tables first (more structured), then the
+        #    surrounding text, with page numbers and content markers
+        # 4. Results are joined back in page order"""
+        relevant_pages = _run_in_pool(_relevant_pages_in_worker, pdf_path)
+        batches = [
+            relevant_pages[start:start + PDF_PAGES_PER_TASK]
+            for start in range(0, len(relevant_pages), PDF_PAGES_PER_TASK)
+        ]
+        extracted_content = [
+            part
+            for batch_parts in _map_in_pool(_extract_pages_in_worker, pdf_path, batches)
+            for part in batch_parts
+        ]
+        return "\n".join(extracted_content) if extracted_content else None
+
+    def _find_relevant_pages(self, pdf_content: Union[str, io.BytesIO]) -> List[int]:
+        """# Indices of pages that talk about emissions, plus their neighbours
+        # - Uses emissions keywords only; the data patterns also match any
+        #   year, which keeps nearly every page of a report
+        # - Neighbouring pages are kept because tables often continue or are
+        #   explained on the next/previous page
+        # (plain text only, so the faster extractor is used when available)"""
+        page_count = 0
+        matched_pages = []
+        for page_num, text in enumerate(_page_texts(pdf_content)):
+            page_count += 1
+            if _EMISSIONS_PAGE_RE.search(text):
+                matched_pages.append(page_num)
+
+        relevant_pages = sorted({
+            neighbour
+            for page_num in matched_pages
+            for neighbour in range(page_num - PDF_PAGE_NEIGHBORS, page_num + PDF_PAGE_NEIGHBORS + 1)
+            if 0 <= neighbour < page_count
+        })
+        if page_count:
+            logging.info(
+                f"Kept {len(relevant_pages)} of {page_count} pages "
+                f"({len(relevant_pages) / page_count:.0%}) for extraction"
+            )
+        return relevant_pages
+
+    def _extract_pages(self, pdf_content: Union[str, io.BytesIO], page_nums: List[int]) -> List[str]:
+        """# Tables, then column-aware text, for each of the given pages"""
+        extracted_content = []
+        with pdfplumber.open(pdf_content) as pdf:
+            for page_num in page_nums:
+                page = pdf.pages[page_num]
+                
+                # Handle tables first
+                tables = page.extract_tables()
+                for table_num, table in enumerate(tables, 1):
+                    if table and len(table) > 1:
+                        processed_table = self._process_table(table)
+                        if processed_table:
+                            extracted_content.append(
+                                f"=== TABLE {table_num} ON PAGE {page_num + 1} ===\n{processed_table}\n"
+                            )
+
+                # Then handle text with column awareness
+                text = self._extract_text_with_columns(page)
+                if text:
+                    context = self._process_text(text)
+                    if context:
+                        extracted_content.append(
+                            f"=== TEXT ON PAGE {page_num + 1} ===\n{context}\n"
+                        )
+        return extracted_content
+
     def _extract_text_with_columns(self, page) -> str:
         """# Smart multi-column text extraction
         # 1. Gets word positions and coordinates
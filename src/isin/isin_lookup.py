@@ -1,57 +1,86 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+from functools import lru_cache
 import yfinance as yf
 import requests
 import logging
-from functools import lru_cache
+import re
+from ..config import ISIN_CACHE_TTL
+from ..utils.helpers import build_http_adapter
+from ..utils.cache import DiskCache
+
+_ISIN_RE = re.compile(r'[A-Za-z]{2}[A-Za-z0-9]{9}[0-9]')
+
+
+def _luhn_digit(digit: int, double: bool) -> int:
+    if double:
+        digit *= 2
+        if digit > 9:
+            digit -= 9
+    return digit
+
+
+def _build_luhn_table() -> Dict[Tuple[str, bool], int]:
+    """Luhn contribution of each ISIN character, by whether its last digit is doubled."""
+    table = {}
+    for char in "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+        value = int(char, 36)  # A=10, B=11, ... Z=35
+        for double in (False, True):
+            if value < 10:
+                table[char, double] = _luhn_digit(value, double)
+            else:
+                # Two digits: the units digit takes this parity, the tens digit the other
+                table[char, double] = _luhn_digit(value % 10, double) + _luhn_digit(value // 10, not double)
+    return table
+
+
+_LUHN_CONTRIBUTION = _build_luhn_table()
+
+
+@lru_cache(maxsize=10_000)
+def _is_valid_isin(isin: str) -> bool:
+    # Two letters (country), nine alphanumerics, one check digit
+    if not _ISIN_RE.fullmatch(isin):
+        return False
+
+    isin = isin.upper()
+
+    # Luhn over the body, right to left; the digit next to the check digit
+    # is doubled first. Letters expand to two digits, so they leave the
+    # doubling parity unchanged while a single digit flips it
+    checksum = 0
+    double = True
+    for char in reversed(isin[:-1]):
+        checksum += _LUHN_CONTRIBUTION[char, double]
+        if char.isdigit():
+            double = not double
+
+    return (10 - checksum % 10) % 10 == int(isin[-1])
 
 class ISINLookup:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Keep-alive session so repeated Yahoo searches reuse one connection
+        self.session = requests.Session()
+        self.session.mount("https://", build_http_adapter())
+        # Successful lookups persist across restarts and are shared by every
+        # worker process; failures are not cached so they're retried
+        self._company_cache = DiskCache("isin_company_info", ISIN_CACHE_TTL)
+        self._name_cache = DiskCache("isin_by_name", ISIN_CACHE_TTL)
 
     def validate_isin(self, isin: str) -> bool:
-        """Validate ISIN using Luhn algorithm"""
-        if not isin or len(isin) != 12:
-            return False
-
-        # Check first two chars are letters
-        if not isin[:2].isalpha():
-            return False
-
-        # Check remaining chars are alphanumeric
-        if not isin[2:].isalnum():
-            return False
-
-        # Convert letters to numbers (A=10, B=11, etc)
-        nums = []
-        for char in isin.upper():
-            if char.isalpha():
-                nums.append(str(ord(char) - ord('A') + 10))
-            else:
-                nums.append(char)
-
-        # Luhn algorithm
-        digits = ''.join(nums)
-        checksum = 0
-        double = True
-
-        for digit in reversed(digits):
-            d = int(digit)
-            if double:
-                d *= 2
-                if d > 9:
-                    d -= 9
-            checksum += d
-            double = not double
-
-        return checksum % 10 == 0
+        """Validate ISIN format and Luhn check digit (results are memoized)"""
+        return isinstance(isin, str) and _is_valid_isin(isin)
 
-    @lru_cache(maxsize=1000)
     def get_company_info(self, isin: str) -> Optional[Dict]:
         """Get company information from ISIN using Yahoo Finance"""
         try:
             if not self.validate_isin(isin):
                 return None
 
+            cached = self._company_cache.get(isin.upper())
+            if cached is not None:
+                return cached
+
             # Convert ISIN to ticker symbol
             ticker = self._isin_to_ticker(isin)
             if not ticker:
@@ -61,13 +90,15 @@ class ISINLookup:
             company = yf.Ticker(ticker)
             info = company.info
 
-            return {
+            company_info = {
                 'name': info.get('longName'),
                 'ticker': ticker,
                 'sector': info.get('sector'),
                 'industry': info.get('industry'),
                 'country': info.get('country')
             }
+            self._company_cache.set(isin.upper(), company_info)
+            return company_info
 
         except Exception as e:
             self.logger.error(f"Error getting company info for {isin}: {str(e)}")
@@ -76,6 +107,11 @@ class ISINLookup:
     def resolve_company_name(self, name: str) -> Optional[str]:
         """Try to find ISIN from company name"""
         try:
+            cache_key = name.strip().lower()
+            cached = self._name_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             # Search Yahoo Finance
             search_url = f"https://query2.finance.yahoo.com/v1/finance/search"
             params = {
@@ -83,7 +119,7 @@ class ISINLookup:
                 'quotesCount': 1,
                 'newsCount': 0
             }
-            response = requests.get(search_url, params=params)
+            response = self.session.get(search_url, params=params, timeout=(5, 30))
             data = response.json()
 
             if not data.get('quotes'):
@@ -95,7 +131,10 @@ class ISINLookup:
                 return None
 
             # Convert ticker to ISIN
-            return self._ticker_to_isin(ticker)
+            isin = self._ticker_to_isin(ticker)
+            if isin:
+                self._name_cache.set(cache_key, isin)
+            return isin
 
         except Exception as e:
             self.logger.error(f"Error resolving company name {name}: {str(e)}")
@@ -110,7 +149,7 @@ class ISINLookup:
                 'quotesCount': 1,
                 'newsCount': 0
             }
-            response = requests.get(search_url, params=params)
+            response = self.session.get(search_url, params=params, timeout=(5, 30))
             data = response.json()
 
             if not data.get('quotes'):
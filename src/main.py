@@ -1,9 +1,9 @@
 import json
 import logging
 import os
+import orjson
 from typing import Dict, Optional
-from .search.brave_search import BraveSearchClient
-from .extraction.pdf_handler import DocumentHandler
+from .search.brave_search import BraveSearchClient, BLACKLIST_FILE
 from .analysis.claude_analyzer import EmissionsAnalyzer
 from .config import DEFAULT_OUTPUT_DIR
 
@@ -28,7 +28,9 @@ class EmissionsTracker:
             # #####################################################################################################
             self.search_client = BraveSearchClient()
             self.analyzer = EmissionsAnalyzer()
-            self.document_handler = DocumentHandler()
+            # Share the search client's handler so the report it validated is
+            # served from its content cache instead of being downloaded again
+            self.document_handler = self.search_client.document_handler
 
             # Create the default output directory if it doesn't exist
             os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
@@ -62,7 +64,7 @@ class EmissionsTracker:
                 logging.warning("No sustainability report found")
                 return None
 
-            logging.info(f"Found report for {company_name} from year {report_data['year']}")
+            logging.info(f"Found report for {company_name} from year {report_data['year'] or 'unknown'}")
             logging.info(f"URL: {report_data['url']}")
 
             # #######################################################################################################
@@ -125,16 +127,17 @@ class EmissionsTracker:
             f"{company_name.lower().replace(' ', '_')}.json"
         )
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # orjson writes UTF-8 without escaping, like ensure_ascii=False
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             logging.info(f"Results saved to {filename}")
         except Exception as e:
             logging.error(f"Failed to save results: {str(e)}")
 
     def _get_timestamp(self) -> str:
-        """Get the current timestamp in ISO format, e.g. 2024-12-19T12:37:48.135777."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        """Get the current UTC timestamp in ISO format, e.g. 2024-12-19T12:37:48.135777+00:00."""
+        from datetime import datetime, timezone
+        return datetime.now(timezone.utc).isoformat()
 
     # ###############################################################################################################
     # A helper method to append a URL to a blacklist file. 
@@ -142,8 +145,7 @@ class EmissionsTracker:
     # This way, future searches can skip this known-bad URL.
     # ###############################################################################################################
     def _add_to_blacklist(self, url: str):
-        blacklist_file = "blacklisted_urls.txt"
-        with open(blacklist_file, "a", encoding="utf-8") as f:
+        with open(BLACKLIST_FILE, "a", encoding="utf-8") as f:
             f.write(url + "\n")
         logging.info(f"URL added to blacklist: {url}")
 
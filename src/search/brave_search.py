@@ -1,14 +1,153 @@
+import orjson
 import requests
 import logging
 import re
 import os
-from typing import Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 from ..config import (
     BRAVE_API_KEY, 
     SEARCH_YEARS, 
-    MAX_RESULTS_PER_SEARCH
+    MAX_RESULTS_PER_SEARCH,
+    MAX_SEARCH_WORKERS,
+    MAX_VALIDATION_WORKERS,
+    MAX_PDF_VALIDATIONS,
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_NEGATIVE_TTL,
+    SEARCH_CACHE_TTL,
+    DOCUMENT_CACHE_TTL,
+    RATE_LIMIT_COOLDOWN,
+    BRAVE_REQUESTS_PER_SECOND
 )
 from ..extraction.pdf_handler import DocumentHandler
+from ..utils.helpers import build_http_adapter
+from ..utils.cache import DiskCache
+from ..utils.rate_limit import RateLimiter
+
+# Log messages use %-style arguments so formatting is skipped when INFO is filtered out
+_BANNER = '=' * 50
+
+BLACKLIST_FILE = "blacklisted_urls.txt"
+
+# Brave's quota is per API key, so every client and thread shares one limiter
+_brave_limiter = RateLimiter(BRAVE_REQUESTS_PER_SECOND)
+
+
+@lru_cache(maxsize=1)
+def _read_blacklist(path: str, mtime: float) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Parse the blacklist into (exact URLs, hosts); cached until the file's mtime changes.
+
+    Lines containing "://" block that exact URL; bare hostnames block the host
+    and all of its subdomains. Blank lines and "#" comments are ignored.
+    """
+    with open(path, "rb") as f:
+        lines = f.read().decode("utf-8").splitlines()
+    entries = [line.strip() for line in lines]
+    entries = [entry for entry in entries if entry and not entry.startswith("#")]
+    urls = frozenset(entry for entry in entries if "://" in entry)
+    hosts = frozenset(entry.lower() for entry in entries if "://" not in entry)
+    return urls, hosts
+
+
+def _load_blacklist(path: str = BLACKLIST_FILE) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return frozenset(), frozenset()
+    return _read_blacklist(path, mtime)
+
+
+# Years before 2022 appearing in a result URL mark an outdated report
+_OLD_YEAR_RE = re.compile(r'\b(?:19\d{2}|20[01]\d|202[01])\b')
+
+# Four-digit years mentioned in a result's title or URL; only digits count as
+# delimiters so "ESG_Report_2026.pdf" and "report2026.pdf" still match
+_YEAR_RE = re.compile(r'(?<!\d)(20\d{2})(?!\d)')
+
+# Brave's upper limit for the count parameter
+BRAVE_MAX_COUNT = 20
+
+
+def _result_year(result_data: Dict) -> Optional[int]:
+    """The first SEARCH_YEARS year named in a result's title, else its URL."""
+    for text in (result_data.get("title", ""), result_data["url"]):
+        for match in _YEAR_RE.findall(text):
+            year = int(match)
+            if year in SEARCH_YEARS:
+                return year
+    return None
+
+
+# Detects Scope 1 emissions references in extracted PDF text
+_SCOPE1_RE = re.compile(r'(?i)scope[\s\-_]*1')
+
+# Title/filename phrases that mark a result as something other than a
+# sustainability report
+NEGATIVE_PATTERNS = (
+    'proxy statement',
+    '10-k',
+    '10k',
+    'financial results',
+    'basis of preparation',
+    'methodology',
+    'reporting framework',
+    'calculation methodology',
+    'reporting guidelines',
+    'basis for reporting',
+    'calculation guide',
+    'data preparation',
+    'reporting criteria',
+    'accounting methodology'
+)
+# Compiled once so each result is checked in a single regex pass (titles
+# match the phrases as-is, filenames use hyphenated variants). Both are
+# matched against text that is already lowercased, so the terms are
+# lowercased here instead of paying for IGNORECASE
+_NEGATIVE_RE = re.compile('|'.join(re.escape(term.lower()) for term in NEGATIVE_PATTERNS))
+_NEGATIVE_FILENAME_RE = re.compile(
+    '|'.join(re.escape(term.lower().replace(' ', '-')) for term in NEGATIVE_PATTERNS)
+)
+
+
+def _normalize_url(url: str) -> str:
+    """Canonical form used to spot the same PDF behind different result URLs.
+
+    Drops the fragment, utm_* tracking parameters and any trailing slash, and
+    lowercases the scheme and host (paths are case-sensitive, so they're kept).
+    """
+    parts = urlparse(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith("utm_")])
+    return urlunparse((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        parts.params,
+        query,
+        ""
+    ))
+
+
+# Words that say nothing about which company a URL belongs to
+_COMPANY_STOPWORDS = frozenset({
+    "the", "and", "of", "inc", "corp", "corporation", "company", "co", "plc",
+    "ltd", "limited", "llc", "group", "holdings", "sa", "ag", "nv", "se"
+})
+
+
+def _company_key(company_name: str) -> str:
+    """Distinctive lowercase word of a company name, for matching its URLs and domain.
+
+    "The Home Depot" -> "home", "The Coca-Cola Company" -> "coca".
+    """
+    words = re.findall(r'[a-z0-9]+', company_name.lower())
+    for word in words:
+        if word not in _COMPANY_STOPWORDS:
+            return word
+    return "".join(words)
 
 
 class BraveSearchClient:
@@ -17,7 +156,7 @@ class BraveSearchClient:
 
     Key Features:
     - Searches for PDFs using company name and year.
-    - Checks a blacklist of URLs before processing (to skip known bad or empty reports).
+    - Checks a blacklist of URLs and hosts before processing (to skip known bad or empty reports).
     - Validates that the PDF contains emissions data (Scope 1 mentioned) before returning.
     - Filters out documents that are clearly not sustainability reports (e.g. proxy statements).
 
@@ -27,6 +166,11 @@ class BraveSearchClient:
     If no such report is found after searching multiple years and results, we return None.
     """
 
+    # Every query is "<company> <kind> <year> filetype:pdf"; add phrasings here
+    # to widen the search (each one costs an extra API call per year)
+    REPORT_KINDS = ("global sustainability report",)
+    SEARCH_TEMPLATE = "{company} {kind} {year} filetype:pdf"
+
     def __init__(self):
         # Store the Brave API key and base URL for HTTP requests
         self.api_key = BRAVE_API_KEY
@@ -36,120 +180,354 @@ class BraveSearchClient:
             "x-subscription-token": self.api_key
         }
 
-        # Initialize the DocumentHandler to extract text from PDFs
-        self.document_handler = DocumentHandler()
+        # One keep-alive session for all Brave queries; the pool is sized so
+        # concurrent queries and PDF validations each reuse a connection
+        # instead of opening (and discarding) new TCP+TLS connections
+        adapter = build_http_adapter(pool_maxsize=max(MAX_SEARCH_WORKERS, MAX_VALIDATION_WORKERS))
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", adapter)
+
+        # Initialize the DocumentHandler to extract text from PDFs. It shares the
+        # connection pools but keeps its own session so the API token is never
+        # sent to report hosts
+        self.document_handler = DocumentHandler(adapter=adapter)
         
-        # Load blacklist file (if it exists) to skip known non-useful URLs
-        self.blacklisted_urls = set()
-        blacklist_file = "blacklisted_urls.txt"
-        if os.path.exists(blacklist_file):
-            with open(blacklist_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    url_line = line.strip()
-                    if url_line and not url_line.startswith("#"):
-                        self.blacklisted_urls.add(url_line)
+        # Blacklisted exact URLs and whole hosts, shared across instances
+        self.blacklisted_urls, self.blacklisted_hosts = _load_blacklist()
 
         # Regex to detect Scope 1 emissions references in extracted PDF text
-        self.scope_1_pattern = re.compile(r'(?i)scope[\s\-_]*1')
+        # (compiled once per process at module scope)
+        self.scope_1_pattern = _SCOPE1_RE
         
-        # Negative patterns to filter out non-sustainability reports
-        self.negative_patterns = [
-            'proxy statement',
-            '10-k',
-            '10k',
-            'financial results',
-            'basis of preparation',
-            'methodology',
-            'reporting framework',
-            'calculation methodology',
-            'reporting guidelines',
-            'basis for reporting',
-            'calculation guide',
-            'data preparation',
-            'reporting criteria',
-            'accounting methodology'
-        ]
+        # Negative patterns to filter out non-sustainability reports (the
+        # compiled matchers are shared module constants)
+        self.negative_patterns = list(NEGATIVE_PATTERNS)
+        self._negative_re = _NEGATIVE_RE
+        self._negative_filename_re = _NEGATIVE_FILENAME_RE
 
-        # Track the last PDF URL that failed due to no emissions data
+        # Track the last PDF URL that failed due to no emissions data; written
+        # from the validation threads, so updates go through the lock
         self.last_failed_url = None
+        self._last_failed_lock = threading.Lock()
+
+        # In-process cache of Brave responses: search term -> (fetched_at, results).
+        # Queries that returned nothing are only trusted for SEARCH_CACHE_NEGATIVE_TTL.
+        self._query_cache: Dict[str, Tuple[float, Tuple[Dict, ...]]] = {}
+        # Written by the query threads and by every web job sharing this client
+        self._query_cache_lock = threading.Lock()
+
+        # Persistent caches shared across runs: non-empty Brave responses, and
+        # whether a PDF URL mentions Scope 1 (True/False)
+        self._search_disk_cache = DiskCache("brave_search", SEARCH_CACHE_TTL)
+        self._scope_1_cache = DiskCache("scope_1_verdicts", DOCUMENT_CACHE_TTL)
+
+        # Monotonic time until which Brave queries are skipped after an HTTP 429
+        self._rate_limited_until = 0.0
 
     def search_sustainability_report(self, company_name: str) -> Optional[Dict]:
-        logging.info(f"\n{'='*50}")
-        logging.info(f"Starting search for {company_name}'s sustainability report")
-        logging.info(f"{'='*50}")
+        logging.info("\n%s", _BANNER)
+        logging.info("Starting search for %s's sustainability report", company_name)
+        logging.info(_BANNER)
 
-        if not company_name.strip():
+        # Normalize once; every search term below reuses it
+        company_name = company_name.strip()
+        if not company_name:
             logging.error("Empty company name provided")
             return None
 
-        for year in SEARCH_YEARS:
-            logging.info(f"\nTrying year: {year}")
-            search_term = f"{company_name} global sustainability report {year} filetype:pdf"
-            logging.info(f"Search query: {search_term}")
+        if time.monotonic() < self._rate_limited_until:
+            logging.warning("Brave Search is rate limited; skipping search for %s", company_name)
+            return None
 
-            try:
-                logging.info("Making request to Brave Search API...")
-                response = requests.get(
-                    self.base_url,
-                    headers=self.headers,
-                    params={"q": search_term, "count": MAX_RESULTS_PER_SEARCH},
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    results = response.json()
-                    web_results = results.get("web", {}).get("results", [])
-
-                    if web_results:
-                        logging.info(f"Found {len(web_results)} potential results")
-                        
-                        for idx, result_data in enumerate(web_results, 1):
-                            url = result_data["url"]
-                            logging.info(f"\nChecking result {idx}: {url}")
-
-                            # Skip if URL is blacklisted
-                            if url in self.blacklisted_urls:
-                                logging.info(f"Skipping blacklisted URL: {url}")
-                                continue
-                            
-                            # Skip URLs with old dates (before 2022)
-                            if re.search(r'\b(19\d{2}|20[0-1]\d|2020|2021)\b', url):
-                                logging.info(f"Skipping (URL too old): {url}")
-                                continue
-
-                            # Check both the title and filename for negative patterns
-                            filename = url.split('/')[-1].lower()
-                            if any(
-                                bad_term in result_data.get("title", "").lower()
-                                or bad_term.replace(' ', '-') in filename
-                                for bad_term in self.negative_patterns
-                            ):
-                                logging.info("Skipping (appears to be non-report document)")
-                                continue
-
-                            # Validate that the PDF contains emissions data
-                            logging.info("Validating document contains emissions data...")
-                            try:
-                                text_content = self.document_handler.get_document_content(url)
-                                if text_content:
-                                    logging.info(f"Successfully extracted {len(text_content):,} characters")
-                                    
-                                    if self.scope_1_pattern.search(text_content):
-                                        logging.info("✓ Found emissions data references")
-                                        return {"url": url, "year": year}
-                                    else:
-                                        logging.info("✗ No emissions data found")
-                                        self.last_failed_url = url
-                            except Exception as e:
-                                logging.error(f"Failed to process PDF: {str(e)}")
-
-                else:
-                    logging.error(f"Search API error: {response.status_code}")
+        company_key = _company_key(company_name)
+        results_by_year = self._collect_results(company_name)
+
+        # Pool every query's results, then rank them so PDF downloads go to the
+        # most promising candidates rather than whichever the newest query returned
+        candidates = []
+        seen_urls = set()
+        for year, web_results in results_by_year.items():
+            logging.info("\nCollecting results for year: %s", year or "unknown")
+            if web_results:
+                logging.info("Found %d potential results", len(web_results))
+            year_str = str(year) if year else ""
+
+            for idx, result_data in enumerate(web_results, 1):
+                url = result_data["url"]
+                title = result_data.get("title", "")
+                # Lowercase once per result; the filters and scoring below share these
+                url_lower = url.lower()
+                title_lower = title.strip().lower()
+                host = urlparse(url_lower).hostname or ""
+                logging.info("\nChecking result %d: %s", idx, url)
+
+                # The same PDF often ranks for several queries (sometimes with
+                # tracking parameters); keep the first, i.e. newest year
+                url_key = _normalize_url(url)
+                if url_key in seen_urls:
+                    logging.info("Skipping (already a candidate)")
+                    continue
 
+                # Skip if URL or its host is blacklisted
+                if url in self.blacklisted_urls or self._is_blacklisted_host(host):
+                    logging.info("Skipping blacklisted URL: %s", url)
+                    continue
+
+                # Skip URLs with old dates (before 2022)
+                if _OLD_YEAR_RE.search(url):
+                    logging.info("Skipping (URL too old): %s", url)
+                    continue
+
+                # Check both the title and filename for negative patterns
+                filename = url_lower.rsplit('/', 1)[-1]
+                if self._negative_re.search(title_lower) or self._negative_filename_re.search(filename):
+                    logging.info("Skipping (appears to be non-report document)")
+                    continue
+
+                seen_urls.add(url_key)
+                score = self._score_candidate(year_str, url_lower, host, title_lower, company_key)
+                candidates.append((score, year, url, title))
+
+        if not candidates:
+            logging.warning("\nNo sustainability report found for %s", company_name)
+            return None
+
+        # Highest score first; the sort is stable so ties keep newest-year order
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        # PDFs already known to lack Scope 1 data would only use up validation
+        # slots (and the cached Brave results keep returning them)
+        candidates = [
+            candidate for candidate in candidates
+            if self._scope_1_cache.get(candidate[2]) is not False
+        ]
+        shortlist = candidates[:MAX_PDF_VALIDATIONS]
+        logging.info("\nValidating top %d of %d candidates", len(shortlist), len(candidates))
+
+        best = self._first_valid_pdf(shortlist)
+        if best:
+            _, year, url, _ = best
+            return {"url": url, "year": year}
+
+        logging.warning("\nNo sustainability report found for %s", company_name)
+        return None
+
+    def _collect_results(self, company_name: str) -> Dict[Optional[int], List[Dict]]:
+        """Gather Brave results for every year in SEARCH_YEARS, bucketed by year.
+
+        A single query per report kind asks for all years at once, e.g.
+        "Acme global sustainability report (2025 OR 2024 OR 2023) filetype:pdf",
+        and each result is filed under the year its title or URL mentions.
+        Only years that query found nothing for get a query of their own.
+        Results naming none of the years are kept too, in a last bucket under
+        None, and are left for scoring to rank.
+        """
+        results_by_year: Dict[Optional[int], List[Dict]] = {year: [] for year in SEARCH_YEARS}
+        undated: List[Dict] = []
+        years_clause = "(" + " OR ".join(str(year) for year in SEARCH_YEARS) + ")"
+        combined_terms = [
+            (None, self.SEARCH_TEMPLATE.format(company=company_name, kind=kind, year=years_clause))
+            for kind in self.REPORT_KINDS
+        ]
+        combined_count = min(MAX_RESULTS_PER_SEARCH * len(SEARCH_YEARS), BRAVE_MAX_COUNT)
+
+        with ThreadPoolExecutor(max_workers=MAX_SEARCH_WORKERS) as executor:
+            for _, web_results in self._run_queries(executor, combined_terms, combined_count):
+                for result_data in web_results:
+                    year = _result_year(result_data)
+                    if year is not None:
+                        results_by_year[year].append(result_data)
+                    else:
+                        undated.append(result_data)
+
+            fallback_terms = [
+                (year, self.SEARCH_TEMPLATE.format(company=company_name, kind=kind, year=year))
+                for year in SEARCH_YEARS if not results_by_year[year]
+                for kind in self.REPORT_KINDS
+            ]
+            for year, web_results in self._run_queries(executor, fallback_terms, MAX_RESULTS_PER_SEARCH):
+                results_by_year[year].extend(web_results)
+
+        results_by_year[None] = undated
+        return results_by_year
+
+    def _run_queries(self, executor: ThreadPoolExecutor, search_terms: List[Tuple], count: int):
+        """Submit (tag, search term) queries together and yield (tag, results) in submission order."""
+        pending = [
+            (tag, search_term, executor.submit(self._query_brave, search_term, count))
+            for tag, search_term in search_terms
+        ]
+        for tag, search_term, future in pending:
+            logging.info("Search query: %s", search_term)
+            try:
+                yield tag, future.result()
             except Exception as e:
-                logging.error(f"Search error: {str(e)}")
+                logging.error("Search error: %s", e)
+
+    def _is_blacklisted_host(self, host: str) -> bool:
+        """Check the host and each parent domain against the blacklisted hosts."""
+        if not self.blacklisted_hosts:
+            return False
+        labels = host.split(".")
+        return any(".".join(labels[i:]) in self.blacklisted_hosts for i in range(len(labels) - 1))
 
-            logging.info(f"No suitable {year} report found for {company_name}")
+    def _score_candidate(self, year_str: str, url_lower: str, host: str, title_lower: str, company_key: str) -> int:
+        """Cheap relevance score used to order candidates before any PDF is downloaded."""
+        score = 0
+        # year_str is empty for results that name no year
+        if year_str and year_str in title_lower:
+            score += 10
+        if year_str and year_str in url_lower:
+            score += 2
+        if company_key in url_lower:
+            score += 5
+            # Hosted on the company's own domain rather than a filings aggregator
+            if company_key in host:
+                score += 3
+        if "sustainability" in url_lower:
+            score += 2
+        return score
 
-        logging.warning(f"\nNo sustainability report found for {company_name}")
+    def _first_valid_pdf(self, candidates: List[Tuple[int, Optional[int], str, str]]) -> Optional[Tuple[int, Optional[int], str, str]]:
+        """Validate candidate PDFs in parallel and return the best-ranked one that mentions Scope 1."""
+        if not candidates:
+            return None
+
+        # Different hosts download in parallel, but each host serves one PDF at a time
+        host_locks = {urlparse(candidate[2]).netloc: threading.Lock() for candidate in candidates}
+
+        def validate(url: str) -> bool:
+            with host_locks[urlparse(url).netloc]:
+                return self._validate_pdf(url)
+
+        executor = ThreadPoolExecutor(max_workers=min(MAX_VALIDATION_WORKERS, len(candidates)))
+        futures = [executor.submit(validate, candidate[2]) for candidate in candidates]
+        try:
+            # Downloads overlap, but results are taken in rank order
+            for candidate, future in zip(candidates, futures):
+                if future.result():
+                    return candidate
+        finally:
+            # Drop validations that haven't started; running downloads finish in the background
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
         return None
+
+    def _validate_pdf(self, url: str) -> bool:
+        """Check that a candidate PDF contains emissions data (Scope 1 mentioned)."""
+        logging.info("Validating document contains emissions data: %s", url)
+        verdict = self._scope_1_cache.get(url)
+        if verdict is True:
+            logging.info("✓ Previously found emissions data references: %s", url)
+            return True
+        if verdict is False:
+            logging.info("✗ Previously found without emissions data: %s", url)
+            return False
+
+        try:
+            # A HEAD request weeds out dead links, HTML landing pages and
+            # oversized files before any PDF bytes are transferred
+            if not self.document_handler.looks_like_pdf(url):
+                logging.info("✗ Not a usable PDF: %s", url)
+                return False
+
+            # Cheap first pass on the opening pages before a full download
+            preview = self.document_handler.peek(url)
+            if preview and self._mentions_scope_1(preview):
+                logging.info("✓ Found emissions data references in preview: %s", url)
+                self._scope_1_cache.set(url, True)
+                return True
+
+            # Page-by-page scan that stops at the first match; the full
+            # extraction only happens later for the report we pick
+            found = self.document_handler.contains_pattern(url, self.scope_1_pattern, prefilter="scope")
+            if found:
+                logging.info("✓ Found emissions data references: %s", url)
+                self._scope_1_cache.set(url, True)
+                return True
+            if found is False:
+                logging.info("✗ No emissions data found: %s", url)
+                with self._last_failed_lock:
+                    self.last_failed_url = url
+                self._scope_1_cache.set(url, False)
+        except Exception as e:
+            logging.error("Failed to process PDF: %s", e)
+        return False
+
+    def _mentions_scope_1(self, text: str) -> bool:
+        """Check for a Scope 1 reference, using a plain substring scan to reject text before the regex runs."""
+        lowered = text.lower()
+        start = lowered.find("scope")
+        if start < 0:
+            return False
+        # Resume the regex at the first "scope" instead of rescanning the prefix
+        return self.scope_1_pattern.search(lowered, start) is not None
+
+    def _query_brave(self, search_term: str, count: int = MAX_RESULTS_PER_SEARCH) -> Tuple[Dict, ...]:
+        """Run a single Brave query, reusing cached results for repeated search terms."""
+        with self._query_cache_lock:
+            cached = self._query_cache.get(search_term)
+        if cached is not None:
+            fetched_at, web_results = cached
+            if web_results or time.monotonic() - fetched_at < SEARCH_CACHE_NEGATIVE_TTL:
+                logging.info("Using cached search results")
+                return web_results
+
+        # Results from earlier runs survive restarts via the on-disk cache
+        stored = self._search_disk_cache.get(search_term)
+        if stored:
+            logging.info("Using cached search results from disk")
+            web_results = tuple(stored)
+            self._remember_query(search_term, web_results)
+            return web_results
+
+        # Once Brave has rate limited us, don't spend the remaining queries
+        if time.monotonic() < self._rate_limited_until:
+            logging.warning("Skipping query while Brave rate limit cools down")
+            return ()
+
+        # Wait for a slot rather than bursting into 429s
+        _brave_limiter.wait()
+        logging.info("Making request to Brave Search API...")
+        response = self.session.get(
+            self.base_url,
+            params={"q": search_term, "count": count},
+            timeout=(5, 30)
+        )
+
+        self._adapt_rate_limit(response)
+
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After", "")
+            delay = int(retry_after) if retry_after.isdigit() else RATE_LIMIT_COOLDOWN
+            self._rate_limited_until = time.monotonic() + delay
+            logging.error("Search API rate limit hit; pausing searches for %ds", delay)
+            return ()
+
+        if response.status_code != 200:
+            # Errors are not cached so the next attempt goes back to the API
+            logging.error("Search API error: %s", response.status_code)
+            return ()
+
+        results = orjson.loads(response.content)
+        web_results = tuple(results.get("web", {}).get("results", []))
+
+        self._remember_query(search_term, web_results)
+        if web_results:
+            self._search_disk_cache.set(search_term, list(web_results))
+        return web_results
+
+    def _adapt_rate_limit(self, response):
+        """Follow the per-second limit Brave reports, e.g. "X-RateLimit-Limit: 1, 15000"."""
+        per_second = response.headers.get("X-RateLimit-Limit", "").split(",")[0].strip()
+        if per_second.isdigit():
+            _brave_limiter.set_rate(int(per_second))
+
+    def _remember_query(self, search_term: str, web_results: Tuple[Dict, ...]):
+        """Add a response to the in-process query cache, evicting the oldest entry once full."""
+        with self._query_cache_lock:
+            self._query_cache.pop(search_term, None)
+            if len(self._query_cache) >= SEARCH_CACHE_SIZE:
+                self._query_cache.pop(next(iter(self._query_cache)))
+            self._query_cache[search_term] = (time.monotonic(), web_results)
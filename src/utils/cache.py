@@ -0,0 +1,118 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from ..config import CACHE_DB_PATH
+
+# Every DiskCache created in this process, for cache_stats()
+_instances: List["DiskCache"] = []
+
+# Expired rows are deleted when a cache connects and then every this many writes
+_PURGE_EVERY_WRITES = 200
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss counters per namespace, summed over this process's DiskCache instances."""
+    stats: Dict[str, Dict[str, int]] = {}
+    for cache in list(_instances):
+        with cache._lock:
+            hits, misses = cache.hits, cache.misses
+        entry = stats.setdefault(cache.namespace, {"hits": 0, "misses": 0})
+        entry["hits"] += hits
+        entry["misses"] += misses
+    return stats
+
+
+class DiskCache:
+    """
+    Small persistent key/value cache backed by a SQLite file.
+
+    Each instance works on its own namespace inside the shared database and
+    expires entries older than `ttl` seconds on read. Expired entries stay
+    readable with allow_expired for another `keep_expired` seconds, after
+    which they are purged from the file. Values must be JSON serializable.
+    SQLite handles locking, so the same file can be used from several
+    threads and worker processes.
+    """
+
+    def __init__(self, namespace: str, ttl: float, path: str = CACHE_DB_PATH, keep_expired: float = 0):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.path = path
+        self.keep_expired = keep_expired
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        _instances.append(self)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connect lazily so creating a cache never touches the disk
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            # WAL lets readers proceed while another thread or worker process
+            # writes, and commits append to the log instead of rewriting pages
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT, key TEXT, value TEXT, stored_at REAL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._purge()
+        return self._conn
+
+    def _purge(self) -> None:
+        # Rows are otherwise only ever replaced, so without this the file
+        # keeps every document and response ever cached
+        self._conn.execute(
+            "DELETE FROM cache WHERE namespace = ? AND stored_at < ?",
+            (self.namespace, time.time() - self.ttl - self.keep_expired)
+        )
+        self._conn.commit()
+
+    def get(self, key: str, allow_expired: bool = False) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired.
+
+        With allow_expired=True entries past the TTL are still returned, so
+        callers can revalidate them instead of starting from scratch.
+        """
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT value, stored_at FROM cache WHERE namespace = ? AND key = ?",
+                    (self.namespace, key)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logging.warning(f"Cache read failed ({self.namespace}): {str(e)}")
+            return None
+
+        hit = row is not None and (allow_expired or time.time() - row[1] <= self.ttl)
+        # Counters are shared by every request thread and read by /metrics
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            hits, misses = self.hits, self.misses
+        logging.debug("Cache %s (%s): %d hits / %d misses", "hit" if hit else "miss", self.namespace, hits, misses)
+        return json.loads(row[0]) if hit else None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, replacing any previous entry."""
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (namespace, key, value, stored_at) VALUES (?, ?, ?, ?)",
+                    (self.namespace, key, json.dumps(value), time.time())
+                )
+                self._writes += 1
+                if self._writes % _PURGE_EVERY_WRITES == 0:
+                    self._purge()
+                conn.commit()
+        except sqlite3.Error as e:
+            logging.warning(f"Cache write failed ({self.namespace}): {str(e)}")
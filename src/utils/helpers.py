@@ -1,16 +1,33 @@
 from typing import Optional
-import json
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from ..config import MAX_RETRIES
+
+def build_http_adapter(pool_maxsize: int = 10) -> HTTPAdapter:
+    """Create a pooled HTTP adapter that retries transient failures with backoff.
+
+    429s are deliberately not retried here; callers handle rate limits themselves.
+    """
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False
+    )
+    return HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+
 
 def save_json(data: dict, filepath: str) -> None:
     """Save data to JSON file with proper formatting."""
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 def load_json(filepath: str) -> Optional[dict]:
     """Load data from JSON file."""
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     except Exception as e:
         print(f"Error loading JSON: {str(e)}")
         return None
\ No newline at end of file
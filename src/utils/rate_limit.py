@@ -0,0 +1,31 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket with a capacity of one: spaces calls out so that at most
+    `rate` of them start per second, shared by every thread that uses it.
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float) -> None:
+        """Change the allowed calls per second, e.g. from a server's rate-limit headers."""
+        if rate > 0:
+            with self._lock:
+                self.interval = 1.0 / rate
+
+    def wait(self) -> None:
+        """Block until the caller may start its call."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
@@ -1,11 +1,24 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, url_for
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 import logging
+import orjson
 from src.search.brave_search import BraveSearchClient
 from src.analysis.claude_analyzer import EmissionsAnalyzer
-from src.extraction.pdf_handler import DocumentHandler
 from src.isin.isin_lookup import ISINLookup
-import json
-from datetime import datetime
+from src.utils.cache import cache_stats
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from src.config import (
+    MAX_ANALYSIS_WORKERS,
+    ANALYSIS_JOB_TTL,
+    ANALYSIS_CACHE_SIZE,
+    ANALYSIS_CACHE_TTL,
+    MAX_REQUEST_BYTES
+)
 
 # Configure logging
 logging.basicConfig(
@@ -13,14 +26,67 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-app = Flask(__name__)
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and request.get_json"""
+
+    def dumps(self, obj, **kwargs):
+        # orjson encodes datetimes natively; self.default covers the rest
+        # (e.g. Decimal) the same way Flask's default provider does
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class ORJSONFlask(Flask):
+    json_provider_class = ORJSONProvider
+
+app = ORJSONFlask(__name__)
+# Requests only carry a company name or ISIN; refuse oversized bodies before
+# they are read and parsed in a request thread
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BYTES
+
+# Results JSON (repeated keys, years, units) compresses well; brotli or gzip
+# depending on the client's Accept-Encoding, small responses left as-is
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
+def _preload_templates():
+    """Compile every template now so the first page load doesn't pay for it"""
+    for template_name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(template_name)
+
+_preload_templates()
 
 # Initialize components
 search_client = BraveSearchClient()
 analyzer = EmissionsAnalyzer()
-document_handler = DocumentHandler()
+# Reuse the search client's handler so validated reports come from its cache
+document_handler = search_client.document_handler
 isin_lookup = ISINLookup()
 
+# Analyses take many seconds of network I/O, so they run on a background pool
+# instead of holding a request thread; clients poll /analyze/<job_id>
+executor = ThreadPoolExecutor(max_workers=MAX_ANALYSIS_WORKERS)
+jobs = {}  # job_id -> (submitted_at, Future)
+running_jobs = {}  # (identifier, id_type) -> job_id of an unfinished job
+jobs_lock = threading.Lock()
+
+# Successful analyses by (identifier, id_type), so a re-submitted company is
+# answered without repeating the search, download and Claude calls
+analysis_cache = {}  # key -> (stored_at, result)
+analysis_cache_lock = threading.Lock()
+
+@app.errorhandler(413)
+def request_too_large(error):
+    return jsonify({'error': 'Request too large'}), 413
+
 @app.route('/')
 def home():
     return render_template('index.html')
@@ -55,32 +121,123 @@ def validate_isin(isin):
 
 @app.route('/analyze', methods=['POST'])
 def analyze():
+    """Start an analysis in the background and return its job id"""
+    data = request.get_json(silent=True) or {}
+    identifier = data.get('identifier')
+    id_type = data.get('id_type', 'company')
+
+    if not identifier or not isinstance(identifier, str):
+        logging.error("Empty identifier provided")
+        return jsonify({'error': 'Identifier required'}), 400
+
+    # Reject malformed ISINs right away instead of queueing a job that would
+    # only fail; normalizing also lets "us67066g1040 " share cached results
+    if id_type == 'isin':
+        identifier = identifier.strip().upper()
+        if not isin_lookup.validate_isin(identifier):
+            logging.error(f"Invalid ISIN format: {identifier}")
+            return jsonify({'error': 'Invalid ISIN format'}), 400
+
+    key = _analysis_key(identifier, id_type)
+    with jobs_lock:
+        _prune_jobs()
+        # Identical requests arriving while one is still running share its job
+        # instead of repeating the search and Claude calls
+        job_id = running_jobs.get(key)
+        if job_id is not None:
+            logging.info(f"Joining running analysis {job_id} for {identifier}")
+        else:
+            job_id = uuid.uuid4().hex
+            jobs[job_id] = (time.monotonic(), executor.submit(_run_analysis, identifier, id_type))
+            running_jobs[key] = job_id
+            logging.info(f"Queued analysis {job_id} for {identifier} (Type: {id_type})")
+
+    status_url = url_for('analysis_status', job_id=job_id)
+    return jsonify({'job_id': job_id, 'status_url': status_url}), 202, {'Location': status_url}
+
+@app.route('/analyze/<job_id>')
+def analysis_status(job_id):
+    """Poll a background analysis; returns its result once finished"""
+    with jobs_lock:
+        job = jobs.get(job_id)
+
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+
+    _, future = job
+    if not future.done():
+        return jsonify({'status': 'pending'}), 202
+
+    result, status = future.result()
+    return jsonify(result), status
+
+@app.route('/metrics')
+def metrics():
+    """Cache hit/miss counters and job counts for this worker process"""
+    with jobs_lock:
+        job_counts = {
+            'tracked': len(jobs),
+            'running': sum(not future.done() for _, future in jobs.values())
+        }
+    with analysis_cache_lock:
+        analysis_entries = len(analysis_cache)
+
+    return jsonify({
+        'disk_caches': cache_stats(),
+        'analysis_cache_entries': analysis_entries,
+        'jobs': job_counts
+    })
+
+def _prune_jobs():
+    """Forget jobs submitted more than ANALYSIS_JOB_TTL ago (caller holds jobs_lock)"""
+    cutoff = time.monotonic() - ANALYSIS_JOB_TTL
+    for job_id in [job_id for job_id, (submitted_at, future) in jobs.items()
+                   if submitted_at < cutoff and future.done()]:
+        del jobs[job_id]
+    for key in [key for key, job_id in running_jobs.items()
+                if job_id not in jobs or jobs[job_id][1].done()]:
+        del running_jobs[key]
+
+def _analysis_key(identifier, id_type):
+    """Requests that differ only in case or surrounding spaces are the same analysis"""
+    return (identifier.strip().lower(), id_type)
+
+def _run_analysis(identifier, id_type):
+    """Background job body: reuse a recent successful analysis or run a new one"""
+    cache_key = _analysis_key(identifier, id_type)
+    with analysis_cache_lock:
+        cached = analysis_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < ANALYSIS_CACHE_TTL:
+        logging.info(f"Using cached analysis for {identifier}")
+        return cached[1], 200
+
+    result, status = _analyze_identifier(identifier, id_type)
+    if status == 200:
+        with analysis_cache_lock:
+            analysis_cache.pop(cache_key, None)
+            if len(analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                analysis_cache.pop(next(iter(analysis_cache)))
+            analysis_cache[cache_key] = (time.monotonic(), result)
+    return result, status
+
+def _analyze_identifier(identifier, id_type):
+    """Search, extract and analyze one company; returns (response body, HTTP status)"""
     try:
-        data = request.get_json()
-        identifier = data.get('identifier')
-        id_type = data.get('id_type', 'company')
-        
         logging.info(f"\n{'='*50}")
         logging.info(f"New Analysis Request: {identifier} (Type: {id_type})")
         logging.info(f"{'='*50}")
 
-        if not identifier:
-            logging.error("Empty identifier provided")
-            return jsonify({'error': 'Identifier required'}), 400
-
         # Handle ISIN input
         company_name = None
         original_isin = None
         company_info = None
 
         if id_type == 'isin':
-            if not isin_lookup.validate_isin(identifier):
-                logging.error(f"Invalid ISIN format: {identifier}")
-                return jsonify({'error': 'Invalid ISIN format'}), 400
+            # Format was already checked when the job was queued
             company_info = isin_lookup.get_company_info(identifier)
             if not company_info:
                 logging.error(f"Company not found for ISIN: {identifier}")
-                return jsonify({'error': 'Company not found for ISIN'}), 404
+                return {'error': 'Company not found for ISIN'}, 404
             company_name = company_info['name']
             original_isin = identifier
             logging.info(f"Resolved ISIN {identifier} to company {company_name}")
@@ -119,24 +276,24 @@ def analyze():
                         'report_url': report_data['url'],
                         'report_year': report_data['year'],
                         'emissions_data': emissions_data,
-                        'processed_at': datetime.utcnow().isoformat()
+                        'processed_at': datetime.now(timezone.utc)
                     }
 
                     logging.info("\nAnalysis complete ✓")
-                    return jsonify(result)
+                    return result, 200
                 else:
                     logging.error("No emissions data found in report")
-                    return jsonify({'error': 'No emissions data found'}), 404
+                    return {'error': 'No emissions data found'}, 404
             else:
                 logging.error("Failed to extract text from document")
-                return jsonify({'error': 'Failed to extract text'}), 500
+                return {'error': 'Failed to extract text'}, 500
         else:
             logging.error("No sustainability report found")
-            return jsonify({'error': 'No report found'}), 404
+            return {'error': 'No report found'}, 404
 
     except Exception as e:
         logging.error(f"Error: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return {'error': str(e)}, 500
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    app.run()
\ No newline at end of file
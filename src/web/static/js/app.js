@@ -72,12 +72,14 @@ document.getElementById('searchForm').addEventListener('submit', async (e) => {
             })
         });
         
-        const data = await response.json();
+        const job = await response.json();
         
         if (!response.ok) {
-            throw new Error(data.error || 'Failed to analyze emissions data');
+            throw new Error(job.error || 'Failed to analyze emissions data');
         }
         
+        const data = await waitForAnalysis(job.status_url);
+        
         // Update results display
         updateResults(data);
         document.getElementById('results').classList.remove('hidden');
@@ -90,6 +92,22 @@ document.getElementById('searchForm').addEventListener('submit', async (e) => {
     }
 });
 
+// Poll a background analysis until it finishes
+async function waitForAnalysis(statusUrl) {
+    while (true) {
+        const response = await fetch(statusUrl);
+        const data = await response.json();
+        
+        if (response.status !== 202) {
+            if (!response.ok) {
+                throw new Error(data.error || 'Failed to analyze emissions data');
+            }
+            return data;
+        }
+        await new Promise(resolve => setTimeout(resolve, 2000));
+    }
+}
+
 // Update results with charts
 function updateResults(data) {
     // Update company info
@@ -98,7 +116,7 @@ function updateResults(data) {
         <div><strong>Company:</strong> ${data.company}</div>
         ${data.original_isin ? `<div><strong>ISIN:</strong> ${data.original_isin}</div>` : ''}
         ${data.emissions_data.sector ? `<div><strong>Sector:</strong> ${data.emissions_data.sector}</div>` : ''}
-        <div><strong>Report Year:</strong> ${data.report_year}</div>
+        <div><strong>Report Year:</strong> ${data.report_year ?? 'Unknown'}</div>
     `;
 
     // Update raw data display
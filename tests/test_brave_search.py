@@ -0,0 +1,179 @@
+import unittest
+from unittest import mock
+from src.config import SEARCH_YEARS
+from src.search.brave_search import BraveSearchClient, _company_key, _normalize_url, _result_year
+
+THIS_YEAR, LAST_YEAR, OLDEST_YEAR = SEARCH_YEARS
+
+class TestNormalizeUrl(unittest.TestCase):
+    def test_strips_tracking_and_fragment(self):
+        # Test utm_* parameters and fragment are dropped, other parameters kept
+        url = "https://example.com/report.pdf?utm_source=brave&id=7&UTM_Medium=x#page=3"
+        self.assertEqual(_normalize_url(url), "https://example.com/report.pdf?id=7")
+
+    def test_lowercases_scheme_and_host_only(self):
+        # Test paths keep their case
+        self.assertEqual(
+            _normalize_url("HTTPS://Example.COM/Reports/ESG_2024.pdf"),
+            "https://example.com/Reports/ESG_2024.pdf"
+        )
+
+    def test_trailing_slash(self):
+        # Test trailing slash doesn't make a different URL
+        self.assertEqual(
+            _normalize_url("https://example.com/reports/"),
+            _normalize_url("https://example.com/reports")
+        )
+
+class TestBlacklistedHost(unittest.TestCase):
+    def setUp(self):
+        self.client = BraveSearchClient()
+        self.client.blacklisted_hosts = frozenset({"example.com"})
+
+    def test_exact_host(self):
+        self.assertTrue(self.client._is_blacklisted_host("example.com"))
+
+    def test_subdomain(self):
+        # Test parent domains are checked too
+        self.assertTrue(self.client._is_blacklisted_host("files.cdn.example.com"))
+
+    def test_similar_host_not_blacklisted(self):
+        # Test only whole labels match
+        self.assertFalse(self.client._is_blacklisted_host("notexample.com"))
+        self.assertFalse(self.client._is_blacklisted_host("example.com.evil.org"))
+
+    def test_empty_blacklist(self):
+        self.client.blacklisted_hosts = frozenset()
+        self.assertFalse(self.client._is_blacklisted_host("example.com"))
+
+class TestCompanyKey(unittest.TestCase):
+    def test_skips_leading_article_and_suffixes(self):
+        # Test "The" and legal suffixes don't become the key
+        self.assertEqual(_company_key("The Home Depot"), "home")
+        self.assertEqual(_company_key("The Coca-Cola Company"), "coca")
+        self.assertEqual(_company_key("Inc. Acme Holdings"), "acme")
+
+    def test_plain_name(self):
+        self.assertEqual(_company_key("  Microsoft Corporation "), "microsoft")
+
+    def test_only_stopwords(self):
+        # Test a name made only of stopwords still gives a key
+        self.assertEqual(_company_key("The Company"), "thecompany")
+
+class TestResultYear(unittest.TestCase):
+    def test_title_before_url(self):
+        # Test the title's year wins over the URL's
+        result = {"title": f"Acme {LAST_YEAR} Report", "url": f"https://acme.com/{THIS_YEAR}/esg.pdf"}
+        self.assertEqual(_result_year(result), LAST_YEAR)
+
+    def test_year_inside_filename(self):
+        # Test years joined to letters or underscores still count
+        self.assertEqual(_result_year({"url": f"https://acme.com/ESG_Report_{THIS_YEAR}.pdf"}), THIS_YEAR)
+        self.assertEqual(_result_year({"url": f"https://acme.com/report{LAST_YEAR}.pdf"}), LAST_YEAR)
+
+    def test_longer_numbers_are_not_years(self):
+        self.assertIsNone(_result_year({"url": f"https://acme.com/doc{THIS_YEAR}1.pdf"}))
+
+    def test_no_searched_year(self):
+        # Test years outside SEARCH_YEARS and undated results give None
+        self.assertIsNone(_result_year({"title": "Acme 2015 Report", "url": "https://acme.com/esg.pdf"}))
+        self.assertIsNone(_result_year({"url": "https://acme.com/report.pdf"}))
+
+class TestCollectResults(unittest.TestCase):
+    def setUp(self):
+        self.client = BraveSearchClient()
+        self.queries = []
+
+    def collect(self, combined_results, fallback_results=()):
+        def query(search_term, count):
+            self.queries.append(search_term)
+            return combined_results if " OR " in search_term else fallback_results
+
+        with mock.patch.object(self.client, "_query_brave", side_effect=query):
+            return self.client._collect_results("Acme")
+
+    def test_buckets_by_year_with_undated_last(self):
+        # Test results are filed by the year they name, undated ones under None
+        this_year = {"title": f"Acme {THIS_YEAR} Report", "url": "https://acme.com/a.pdf"}
+        last_year = {"title": "Acme Report", "url": f"https://acme.com/esg_{LAST_YEAR}.pdf"}
+        oldest = {"title": f"Acme {OLDEST_YEAR}", "url": "https://acme.com/c.pdf"}
+        undated = {"title": "Acme Report", "url": "https://acme.com/report.pdf"}
+        results = self.collect((this_year, undated, last_year, oldest))
+
+        self.assertEqual(list(results), [*SEARCH_YEARS, None])
+        self.assertEqual(results[THIS_YEAR], [this_year])
+        self.assertEqual(results[LAST_YEAR], [last_year])
+        self.assertEqual(results[OLDEST_YEAR], [oldest])
+        self.assertEqual(results[None], [undated])
+        # Every year was covered, so only the combined query ran
+        self.assertEqual(len(self.queries), 1)
+
+    def test_fallback_only_for_empty_years(self):
+        # Test undated results don't stop a year getting its own query
+        this_year = {"title": f"Acme {THIS_YEAR} Report", "url": "https://acme.com/a.pdf"}
+        undated = {"title": "Acme Report", "url": "https://acme.com/report.pdf"}
+        fallback = {"title": "Acme Report", "url": "https://acme.com/older.pdf"}
+        results = self.collect((this_year, undated), fallback_results=(fallback,))
+
+        fallback_queries = self.queries[1:]
+        self.assertEqual(len(fallback_queries), 2)
+        self.assertTrue(any(str(LAST_YEAR) in query for query in fallback_queries))
+        self.assertTrue(any(str(OLDEST_YEAR) in query for query in fallback_queries))
+        self.assertEqual(results[LAST_YEAR], [fallback])
+        self.assertEqual(results[None], [undated])
+
+class TestRanking(unittest.TestCase):
+    def setUp(self):
+        self.client = BraveSearchClient()
+        self.client.blacklisted_urls = frozenset()
+        self.client.blacklisted_hosts = frozenset()
+        # No verdicts from earlier runs
+        self.verdicts = {}
+        self.client._scope_1_cache = mock.Mock(get=mock.Mock(side_effect=lambda url: self.verdicts.get(url)))
+
+    def search(self, results_by_year, valid_urls):
+        results = {year: [] for year in SEARCH_YEARS}
+        results[None] = []
+        results.update(results_by_year)
+        with mock.patch.object(self.client, "_collect_results", return_value=results), \
+                mock.patch.object(self.client, "_validate_pdf", side_effect=lambda url: url in valid_urls):
+            return self.client.search_sustainability_report("The Acme Corp")
+
+    def test_prefers_company_domain_and_year_in_title(self):
+        # Test an aggregator copy ranks below the company's own report
+        aggregator = {"title": "Sustainability filings", "url": "https://filings.example.com/doc1.pdf"}
+        own = {"title": f"Acme {THIS_YEAR} Sustainability Report", "url": "https://acme.com/sustainability.pdf"}
+        found = self.search({THIS_YEAR: [aggregator, own]}, {aggregator["url"], own["url"]})
+        self.assertEqual(found, {"url": own["url"], "year": THIS_YEAR})
+
+    def test_company_domain_outranks_aggregator(self):
+        # Test the company's own host wins with otherwise equal results
+        aggregator = {"title": f"{THIS_YEAR} Report", "url": "https://filings.example.com/report.pdf"}
+        own = {"title": f"{THIS_YEAR} Report", "url": "https://www.acme.com/report.pdf"}
+        found = self.search({THIS_YEAR: [aggregator, own]}, {aggregator["url"], own["url"]})
+        self.assertEqual(found, {"url": own["url"], "year": THIS_YEAR})
+
+    def test_skips_negative_documents(self):
+        # Test proxy statements and similar are never candidates
+        deck = {"title": f"Acme {THIS_YEAR} Proxy Statement", "url": "https://acme.com/deck.pdf"}
+        report = {"title": f"Acme {LAST_YEAR} Report", "url": "https://acme.com/report.pdf"}
+        found = self.search({THIS_YEAR: [deck], LAST_YEAR: [report]}, {deck["url"], report["url"]})
+        self.assertEqual(found, {"url": report["url"], "year": LAST_YEAR})
+
+    def test_undated_result_has_no_year(self):
+        # Test an undated report isn't reported as this year's
+        undated = {"title": "Acme Report", "url": "https://acme.com/report.pdf"}
+        found = self.search({None: [undated]}, {undated["url"]})
+        self.assertEqual(found, {"url": undated["url"], "year": None})
+
+    def test_known_invalid_pdfs_do_not_use_shortlist(self):
+        # Test cached "no Scope 1" verdicts are skipped before the shortlist is cut
+        results = [
+            {"title": f"Acme {THIS_YEAR} Report", "url": f"https://acme.com/{i}.pdf"} for i in range(6)
+        ]
+        self.verdicts = {result["url"]: False for result in results[:5]}
+        found = self.search({THIS_YEAR: results}, {results[5]["url"]})
+        self.assertEqual(found, {"url": results[5]["url"], "year": THIS_YEAR})
+
+if __name__ == '__main__':
+    unittest.main()
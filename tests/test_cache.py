@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.utils.cache import DiskCache
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = DiskCache("test", ttl=60, path=os.path.join(tmp_dir.name, "cache.sqlite3"))
+        self.addCleanup(lambda: self.cache._conn and self.cache._conn.close())
+        # Controlled clock for stored_at and expiry checks
+        patcher = mock.patch("src.utils.cache.time")
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.clock.time.return_value = 1000.0
+
+    def test_round_trip(self):
+        # Test stored values come back and count as hits
+        self.cache.set("acme", {"text": "Scope 1", "etag": None})
+        self.assertEqual(self.cache.get("acme"), {"text": "Scope 1", "etag": None})
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 0))
+
+    def test_missing_key(self):
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_expires_after_ttl(self):
+        # Test entry is served until the TTL passes, then missed
+        self.cache.set("acme", "report")
+        self.clock.time.return_value = 1060.0
+        self.assertEqual(self.cache.get("acme"), "report")
+        self.clock.time.return_value = 1061.0
+        self.assertIsNone(self.cache.get("acme"))
+
+    def test_allow_expired(self):
+        # Test expired entries stay readable for revalidation
+        self.cache.set("acme", "report")
+        self.clock.time.return_value = 5000.0
+        self.assertIsNone(self.cache.get("acme"))
+        self.assertEqual(self.cache.get("acme", allow_expired=True), "report")
+
+    def test_namespaces_are_separate(self):
+        other = DiskCache("other", ttl=60, path=self.cache.path)
+        self.addCleanup(lambda: other._conn and other._conn.close())
+        self.cache.set("acme", "report")
+        self.assertIsNone(other.get("acme"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,5 +25,15 @@ class TestISINLookup(unittest.TestCase):
         invalid_isin = "12ABCDEFGHIJ"
         self.assertFalse(self.lookup.validate_isin(invalid_isin))
 
+    def test_validate_isin_invalid_check_digit(self):
+        # Test wrong check digit
+        invalid_isin = "US67066G1041"
+        self.assertFalse(self.lookup.validate_isin(invalid_isin))
+
+    def test_validate_isin_legacy_country(self):
+        # Test legacy country code still used by live securities
+        valid_isin = "AN8068571086"  # Schlumberger (Netherlands Antilles)
+        self.assertTrue(self.lookup.validate_isin(valid_isin))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,37 @@
+import unittest
+from unittest import mock
+from src.extraction.pdf_handler import DocumentHandler
+
+class TestFindRelevantPages(unittest.TestCase):
+    def setUp(self):
+        self.handler = DocumentHandler()
+
+    def relevant_pages(self, pages):
+        with mock.patch("src.extraction.pdf_handler._page_texts", return_value=iter(pages)):
+            return self.handler._find_relevant_pages("report.pdf")
+
+    def test_keeps_neighbours_of_emissions_pages(self):
+        # Test each match brings the page before and after it
+        pages = [
+            "Cover",
+            "Message from the CEO",
+            "Scope 1 emissions by region",
+            "Table continued",
+            "Water use",
+            "Biodiversity",
+            "Waste",
+            "GHG inventory methodology",
+        ]
+        self.assertEqual(self.relevant_pages(pages), [1, 2, 3, 6, 7])
+
+    def test_neighbours_stay_inside_document(self):
+        # Test first and last pages don't reach past the ends
+        pages = ["Total tCO2e", "Workforce", "Greenhouse gas targets"]
+        self.assertEqual(self.relevant_pages(pages), [0, 1, 2])
+
+    def test_year_alone_is_not_relevant(self):
+        # Test pages that only mention a year are skipped
+        self.assertEqual(self.relevant_pages(["2024 highlights", "FY23 revenue"]), [])
+
+if __name__ == '__main__':
+    unittest.main()
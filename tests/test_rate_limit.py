@@ -0,0 +1,49 @@
+import threading
+import time
+import unittest
+from src.utils.rate_limit import RateLimiter
+
+class TestRateLimiter(unittest.TestCase):
+    def test_spaces_consecutive_calls(self):
+        # Test 20/s allows one call every 50ms
+        limiter = RateLimiter(20)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_spacing_shared_across_threads(self):
+        # Test threads queue behind each other instead of starting together
+        limiter = RateLimiter(20)
+        starts = []
+        lock = threading.Lock()
+
+        def call():
+            limiter.wait()
+            with lock:
+                starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        self.assertTrue(all(gap >= 0.04 for gap in gaps), gaps)
+
+    def test_set_rate_ignores_non_positive(self):
+        # Test bad rate-limit headers don't change the spacing
+        limiter = RateLimiter(2)
+        limiter.set_rate(0)
+        self.assertEqual(limiter.interval, 0.5)
+        limiter.set_rate(4)
+        self.assertEqual(limiter.interval, 0.25)
+
+    def test_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import threading
+import unittest
+from unittest import mock
+
+# The app creates its API clients at import time
+os.environ.setdefault('CLAUDE_API_KEY', 'test-key')
+os.environ.setdefault('BRAVE_API_KEY', 'test-key')
+
+from src.web import app as web_app
+
+
+class TestAnalyzeJobs(unittest.TestCase):
+    def setUp(self):
+        self.client = web_app.app.test_client()
+        self.calls = []
+        # Analyses block until released so jobs can be seen while still running
+        self.release = threading.Event()
+
+        def fake_analysis(identifier, id_type):
+            self.calls.append(identifier)
+            self.release.wait(5)
+            return {'company': identifier}, 200
+
+        patcher = mock.patch.object(web_app, '_analyze_identifier', side_effect=fake_analysis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Runs before the patch is removed, so no job reaches the real pipeline
+        self.addCleanup(self.finish_all)
+
+    def submit(self, identifier, id_type='company'):
+        return self.client.post('/analyze', json={'identifier': identifier, 'id_type': id_type})
+
+    def finish(self, job_id):
+        self.release.set()
+        web_app.jobs[job_id][1].result(timeout=5)
+
+    def finish_all(self):
+        self.release.set()
+        for _, future in list(web_app.jobs.values()):
+            future.result(timeout=5)
+
+    def test_submit_returns_job_and_status_url(self):
+        # Test 202 with a polling URL in the body and Location header
+        response = self.submit('Submit Corp')
+        self.assertEqual(response.status_code, 202)
+        job = response.get_json()
+        self.assertEqual(job['status_url'], f"/analyze/{job['job_id']}")
+        self.assertTrue(response.headers['Location'].endswith(job['status_url']))
+
+    def test_poll_until_finished(self):
+        # Test pending while running, then the analysis result
+        job = self.submit('Poll Corp').get_json()
+        response = self.client.get(job['status_url'])
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.get_json(), {'status': 'pending'})
+
+        self.finish(job['job_id'])
+        response = self.client.get(job['status_url'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'company': 'Poll Corp'})
+
+    def test_duplicate_request_joins_running_job(self):
+        # Test same company (ignoring case and spaces) shares one job
+        first = self.submit('Coalesce Corp').get_json()
+        second = self.submit('  coalesce corp ').get_json()
+        self.assertEqual(first['job_id'], second['job_id'])
+
+        self.finish(first['job_id'])
+        self.assertEqual(self.calls, ['Coalesce Corp'])
+
+    def test_unknown_job(self):
+        # Test polling a job id that was never issued
+        response = self.client.get('/analyze/not-a-job')
+        self.assertEqual(response.status_code, 404)
+
+    def test_malformed_isin_rejected_before_queueing(self):
+        # Test invalid check digit is refused without starting a job
+        jobs_before = len(web_app.jobs)
+        response = self.submit('US67066G1041', id_type='isin')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {'error': 'Invalid ISIN format'})
+        self.assertEqual(len(web_app.jobs), jobs_before)
+        self.assertEqual(self.calls, [])
+
+if __name__ == '__main__':
+    unittest.main()